@@ -16,7 +16,9 @@
 # limitations under the License.
 """ Configuration base class and utilities."""
 
+import importlib
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -90,38 +92,47 @@ TASK_TAG_TO_NAME_MAPPING = {
 }
 
 
-METRIC_TAGS = [
-    "accuracy",
-    "bleu",
-    "f1",
-    "matthews_correlation",
-    "pearsonr",
-    "precision",
-    "recall",
-    "rouge",
-    "sacrebleu",
-    "spearmanr",
-]
+METRIC_TAGS = frozenset(
+    {
+        "accuracy",
+        "bleu",
+        "f1",
+        "matthews_correlation",
+        "pearsonr",
+        "precision",
+        "recall",
+        "rouge",
+        "sacrebleu",
+        "spearmanr",
+    }
+)
 
 
 def _listify(obj):
     if obj is None:
-        return []
+        return ()
     elif isinstance(obj, str):
-        return [obj]
+        return (obj,)
     else:
         return obj
 
 
+def _add_tag(tags, tag):
+    tags = list(_listify(tags))
+    if tag not in tags:
+        tags.append(tag)
+    return tags
+
+
 def _insert_values_as_list(metadata, name, values):
     if values is None:
         return metadata
     if isinstance(values, str):
-        values = [values]
-    values = [v for v in values if v is not None]
-    if len(values) == 0:
+        metadata[name] = [values]
         return metadata
-    metadata[name] = values
+    values = [v for v in values if v is not None]
+    if len(values) > 0:
+        metadata[name] = values
     return metadata
 
 
@@ -130,9 +141,10 @@ def infer_metric_tags_from_eval_results(eval_results):
         return {}
     result = {}
     for key in eval_results.keys():
-        if key.lower().replace(" ", "_") in METRIC_TAGS:
-            result[key.lower().replace(" ", "_")] = key
-        elif key.lower() == "rouge1":
+        normalized_key = key.lower().replace(" ", "_")
+        if normalized_key in METRIC_TAGS:
+            result[normalized_key] = key
+        elif normalized_key == "rouge1":
             result["rouge"] = key
     return result
 
@@ -144,6 +156,15 @@ def _insert_value(metadata, name, value):
     return metadata
 
 
+_framework_versions = {}
+
+
+def _framework_version(name):
+    if name not in _framework_versions:
+        _framework_versions[name] = importlib.import_module(name).__version__
+    return _framework_versions[name]
+
+
 def is_hf_dataset(dataset):
     if not is_datasets_available():
         return False
@@ -153,14 +174,13 @@ def is_hf_dataset(dataset):
     return isinstance(dataset, Dataset)
 
 
-def _get_mapping_values(mapping):
-    result = []
-    for v in mapping.values():
-        if isinstance(v, (tuple, list)):
-            result += list(v)
-        else:
-            result.append(v)
-    return result
+# Model class name -> task tag, when a class appears under several tasks the last one wins.
+_CLASS_NAME_TO_TASK = {
+    class_name: task
+    for task, mapping in TASK_MAPPING.items()
+    for v in mapping.values()
+    for class_name in (v if isinstance(v, (tuple, list)) else (v,))
+}
 
 
 @dataclass
@@ -183,22 +203,32 @@ class TrainingSummary:
         pass
 
     def create_model_index(self, metric_mapping):
-        model_index = {"name": self.model_name}
+        model_index = {"name": self.model_name, "results": []}
+
+        # Results without metrics are always dropped, so there is nothing to build.
+        if len(metric_mapping) == 0:
+            return [model_index]
 
-        # Dataset mapping tag -> name
         dataset_names = _listify(self.dataset)
         dataset_tags = _listify(self.dataset_tags)
         dataset_args = _listify(self.dataset_args)
-        if len(dataset_args) < len(dataset_tags):
-            dataset_args = dataset_args + [None] * (len(dataset_tags) - len(dataset_args))
-        dataset_mapping = {tag: name for tag, name in zip(dataset_tags, dataset_names)}
-        dataset_arg_mapping = {tag: arg for tag, arg in zip(dataset_tags, dataset_args)}
+        tasks = _listify(self.tasks)
 
-        task_mapping = {
-            task: TASK_TAG_TO_NAME_MAPPING[task] for task in _listify(self.tasks) if task in TASK_TAG_TO_NAME_MAPPING
-        }
+        # Dataset mapping tag -> name
+        if len(dataset_tags) == 0:
+            dataset_mapping = {}
+            dataset_arg_mapping = {}
+        else:
+            if len(dataset_args) < len(dataset_tags):
+                dataset_args = tuple(dataset_args) + (None,) * (len(dataset_tags) - len(dataset_args))
+            dataset_mapping = {tag: name for tag, name in zip(dataset_tags, dataset_names)}
+            dataset_arg_mapping = {tag: arg for tag, arg in zip(dataset_tags, dataset_args)}
 
-        model_index["results"] = []
+        task_mapping = {}
+        for task in tasks:
+            task_name = TASK_TAG_TO_NAME_MAPPING.get(task)
+            if task_name is not None:
+                task_mapping[task] = task_name
 
         if len(task_mapping) == 0 and len(dataset_mapping) == 0:
             return [model_index]
@@ -219,16 +249,15 @@ class TrainingSummary:
                 if dataset_arg_mapping[ds_tag] is not None:
                     result["dataset"]["args"] = dataset_arg_mapping[ds_tag]
 
-            if len(metric_mapping) > 0:
-                result["metrics"] = []
-                for metric_tag, metric_name in metric_mapping.items():
-                    result["metrics"].append(
-                        {
-                            "name": metric_name,
-                            "type": metric_tag,
-                            "value": self.eval_results[metric_name],
-                        }
-                    )
+            result["metrics"] = []
+            for metric_tag, metric_name in metric_mapping.items():
+                result["metrics"].append(
+                    {
+                        "name": metric_name,
+                        "type": metric_tag,
+                        "value": self.eval_results[metric_name],
+                    }
+                )
 
             # Remove partial results to avoid the model card being rejected.
             if "task" in result and "dataset" in result and "metrics" in result:
@@ -253,81 +282,79 @@ class TrainingSummary:
 
     def to_model_card(self):
         import yaml
-        model_card = ""
+        model_card = []
 
-        metadata = yaml.dump(self.create_metadata(), sort_keys=False)
+        # Use the libyaml emitter when PyYAML was built with it.
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        metadata = yaml.dump(self.create_metadata(), Dumper=dumper, sort_keys=False)
         if len(metadata) > 0:
-            model_card = f"---\n{metadata}---\n"
+            model_card.append(f"---\n{metadata}---\n")
 
         # Now the model card for realsies.
         if self.source == "trainer":
-            model_card += AUTOGENERATED_TRAINER_COMMENT
+            model_card.append(AUTOGENERATED_TRAINER_COMMENT)
         else:
-            model_card += AUTOGENERATED_KERAS_COMMENT
+            model_card.append(AUTOGENERATED_KERAS_COMMENT)
 
-        model_card += f"\n# {self.model_name}\n\n"
+        model_card.append(f"\n# {self.model_name}\n\n")
 
         if self.finetuned_from is None:
-            model_card += "This model was trained from scratch on "
+            model_card.append("This model was trained from scratch on ")
         else:
-            model_card += f"This model is a fine-tuned version of [{self.finetuned_from}](https://huggingface.co/{self.finetuned_from}) on "
+            model_card.append(
+                f"This model is a fine-tuned version of [{self.finetuned_from}](https://huggingface.co/{self.finetuned_from}) on "
+            )
 
         if self.dataset is None:
-            model_card += "an unknown dataset."
+            model_card.append("an unknown dataset.")
         else:
             if isinstance(self.dataset, str):
-                model_card += f"the {self.dataset} dataset."
+                model_card.append(f"the {self.dataset} dataset.")
             elif isinstance(self.dataset, (tuple, list)) and len(self.dataset) == 1:
-                model_card += f"the {self.dataset[0]} dataset."
+                model_card.append(f"the {self.dataset[0]} dataset.")
             else:
-                model_card += (
+                model_card.append(
                     ", ".join([f"the {ds}" for ds in self.dataset[:-1]]) + f" and the {self.dataset[-1]} datasets."
                 )
 
         if self.eval_results is not None:
-            model_card += "\nIt achieves the following results on the evaluation set:\n"
-            model_card += "\n".join([f"- {name}: {_maybe_round(value)}" for name, value in self.eval_results.items()])
-        model_card += "\n"
-
-        model_card += "\n## Model description\n\nMore information needed\n"
-        model_card += "\n## Intended uses & limitations\n\nMore information needed\n"
-        model_card += "\n## Training and evaluation data\n\nMore information needed\n"
-
-        model_card += "\n## Training procedure\n"
-        model_card += "\n### Training hyperparameters\n"
+            model_card.append("\nIt achieves the following results on the evaluation set:\n")
+            model_card.append(
+                "\n".join([f"- {name}: {_maybe_round(value)}" for name, value in self.eval_results.items()])
+            )
+        model_card.append("\n")
+
+        model_card.append("\n## Model description\n\nMore information needed\n")
+        model_card.append("\n## Intended uses & limitations\n\nMore information needed\n")
+        model_card.append("\n## Training and evaluation data\n\nMore information needed\n")
+
+        model_card.append("\n## Training procedure\n")
+        model_card.append("\n### Training hyperparameters\n")
         if self.hyperparameters is not None:
-            model_card += "\nThe following hyperparameters were used during training:\n"
-            model_card += "\n".join([f"- {name}: {value}" for name, value in self.hyperparameters.items()])
-            model_card += "\n"
+            model_card.append("\nThe following hyperparameters were used during training:\n")
+            model_card.append("\n".join([f"- {name}: {value}" for name, value in self.hyperparameters.items()]))
+            model_card.append("\n")
         else:
-            model_card += "\nMore information needed\n"
+            model_card.append("\nMore information needed\n")
 
         if self.eval_lines is not None:
-            model_card += "\n### Training results\n\n"
-            model_card += make_markdown_table(self.eval_lines)
-            model_card += "\n"
+            model_card.append("\n### Training results\n\n")
+            model_card.append(make_markdown_table(self.eval_lines))
+            model_card.append("\n")
 
-        model_card += "\n### Framework versions\n\n"
-        # model_card += f"- Framework {__version__}\n"
+        model_card.append("\n### Framework versions\n\n")
+        # model_card.append(f"- Framework {__version__}\n")
 
         if self.source == "trainer" and is_torch_available():
-            import torch
-
-            model_card += f"- Pytorch {torch.__version__}\n"
+            model_card.append(f"- Pytorch {_framework_version('torch')}\n")
         elif self.source == "keras" and is_tf_available():
-            import tensorflow as tf
-
-            model_card += f"- TensorFlow {tf.__version__}\n"
+            model_card.append(f"- TensorFlow {_framework_version('tensorflow')}\n")
         if is_datasets_available():
-            import datasets
-
-            model_card += f"- Datasets {datasets.__version__}\n"
+            model_card.append(f"- Datasets {_framework_version('datasets')}\n")
         if is_tokenizers_available():
-            import tokenizers
-
-            model_card += f"- Tokenizers {tokenizers.__version__}\n"
+            model_card.append(f"- Tokenizers {_framework_version('tokenizers')}\n")
 
-        return model_card
+        return "".join(model_card)
 
     @classmethod
     def from_trainer(
@@ -367,21 +394,13 @@ class TrainingSummary:
 
         # Infer default task tag:
         if tasks is None:
-            model_class_name = trainer.model.__class__.__name__
-            for task, mapping in TASK_MAPPING.items():
-                if model_class_name in _get_mapping_values(mapping):
-                    tasks = task
+            tasks = _CLASS_NAME_TO_TASK.get(trainer.model.__class__.__name__)
 
         if model_name is None:
             model_name = Path(trainer.args.output_dir).name
 
         # Add `generated_from_trainer` to the tags
-        if tags is None:
-            tags = ["generated_from_trainer"]
-        elif isinstance(tags, str) and tags != "generated_from_trainer":
-            tags = [tags, "generated_from_trainer"]
-        elif "generated_from_trainer" not in tags:
-            tags.append("generated_from_trainer")
+        tags = _add_tag(tags, "generated_from_trainer")
 
         _, eval_lines, eval_results = parse_log_history(trainer.state.log_history)
         hyperparameters = extract_hyperparameters_from_trainer(trainer)
@@ -440,18 +459,10 @@ class TrainingSummary:
 
         # Infer default task tag:
         if tasks is None:
-            model_class_name = model.__class__.__name__
-            for task, mapping in TASK_MAPPING.items():
-                if model_class_name in _get_mapping_values(mapping):
-                    tasks = task
+            tasks = _CLASS_NAME_TO_TASK.get(model.__class__.__name__)
 
         # Add `generated_from_keras_callback` to the tags
-        if tags is None:
-            tags = ["generated_from_keras_callback"]
-        elif isinstance(tags, str) and tags != "generated_from_keras_callback":
-            tags = [tags, "generated_from_keras_callback"]
-        elif "generated_from_trainer" not in tags:
-            tags.append("generated_from_keras_callback")
+        tags = _add_tag(tags, "generated_from_keras_callback")
 
         if keras_history is not None:
             _, eval_lines, eval_results = parse_keras_history(keras_history)
@@ -477,6 +488,25 @@ class TrainingSummary:
         )
 
 
+@lru_cache(maxsize=256)
+def _camel_case_key(key):
+    return " ".join([part.capitalize() for part in key.split("_")])
+
+
+def _rename_keras_key(key):
+    if key.startswith("val_"):
+        key = "validation_" + key[4:]
+    elif key != "epoch":
+        key = "train_" + key
+    return _camel_case_key(key)
+
+
+def _rename_log_key(key):
+    if key == "eval_loss":
+        return "Validation Loss"
+    return _camel_case_key(key.partition("_")[2])
+
+
 def parse_keras_history(logs):
     """
     Parse the `logs` of either a `tf.keras.History` object returned by `model.fit()` or an accumulated logs `dict`
@@ -490,81 +520,65 @@ def parse_keras_history(logs):
         # Training logs is a list of dicts, let's invert it to a dict of lists to match a History object
         logs = {log_key: [single_dict[log_key] for single_dict in logs] for log_key in logs[0]}
 
-    lines = []
-    for i in range(len(logs["epoch"])):
-        epoch_dict = {log_key: log_value_list[i] for log_key, log_value_list in logs.items()}
-        values = dict()
-        for k, v in epoch_dict.items():
-            if k.startswith("val_"):
-                k = "validation_" + k[4:]
-            elif k != "epoch":
-                k = "train_" + k
-            splits = k.split("_")
-            name = " ".join([part.capitalize() for part in splits])
-            values[name] = v
-        lines.append(values)
+    # Every epoch shares the same keys, so rename them once.
+    names = {log_key: _rename_keras_key(log_key) for log_key in logs}
+    lines = [
+        {names[log_key]: log_value_list[i] for log_key, log_value_list in logs.items()}
+        for i in range(len(logs["epoch"]))
+    ]
 
     eval_results = lines[-1]
 
     return logs, lines, eval_results
 
 
+_LOG_LINE_SKIPPED_KEYS = frozenset(
+    {"total_flos", "epoch", "step", "eval_runtime", "eval_samples_per_second", "eval_steps_per_second"}
+)
+
+
 def parse_log_history(log_history):
     """
     Parse the `log_history` of a Trainer to get the intermediate and final evaluation results.
     """
-    idx = 0
-    while idx < len(log_history) and "train_runtime" not in log_history[idx]:
-        idx += 1
+    train_idx = None
+    eval_idx = -1
+    lines = []
+    append_line = lines.append
+    training_loss = "No log"
+    for i, entry in enumerate(log_history):
+        if "eval_loss" in entry:
+            eval_idx = i
+        # Intermediate results are only collected up to the training logs.
+        if train_idx is not None:
+            continue
+        if "train_runtime" in entry:
+            train_idx = i
+            continue
+        if "loss" in entry:
+            training_loss = entry["loss"]
+        if "eval_loss" in entry:
+            values = {"Training Loss": training_loss, "Epoch": entry.get("epoch"), "Step": entry.get("step")}
+            values.update({_rename_log_key(k): v for k, v in entry.items() if k not in _LOG_LINE_SKIPPED_KEYS})
+            append_line(values)
 
     # If there are no training logs
-    if idx == len(log_history):
-        idx -= 1
-        while idx >= 0 and "eval_loss" not in log_history[idx]:
-            idx -= 1
-
-        if idx > 0:
-            return None, None, log_history[idx]
+    if train_idx is None:
+        if eval_idx > 0:
+            return None, None, log_history[eval_idx]
         else:
             return None, None, None
 
     # From now one we can assume we have training logs:
-    train_log = log_history[idx]
-    lines = []
-    training_loss = "No log"
-    for i in range(idx):
-        if "loss" in log_history[i]:
-            training_loss = log_history[i]["loss"]
-        if "eval_loss" in log_history[i]:
-            metrics = log_history[i].copy()
-            _ = metrics.pop("total_flos", None)
-            epoch = metrics.pop("epoch", None)
-            step = metrics.pop("step", None)
-            _ = metrics.pop("eval_runtime", None)
-            _ = metrics.pop("eval_samples_per_second", None)
-            _ = metrics.pop("eval_steps_per_second", None)
-            values = {"Training Loss": training_loss, "Epoch": epoch, "Step": step}
-            for k, v in metrics.items():
-                if k == "eval_loss":
-                    values["Validation Loss"] = v
-                else:
-                    splits = k.split("_")
-                    name = " ".join([part.capitalize() for part in splits[1:]])
-                    values[name] = v
-            lines.append(values)
-
-    idx = len(log_history) - 1
-    while idx >= 0 and "eval_loss" not in log_history[idx]:
-        idx -= 1
-
-    if idx > 0:
+    train_log = log_history[train_idx]
+
+    if eval_idx > 0:
         eval_results = {}
-        for key, value in log_history[idx].items():
+        for key, value in log_history[eval_idx].items():
             if key.startswith("eval_"):
                 key = key[5:]
             if key not in ["runtime", "samples_per_second", "steps_per_second", "epoch", "step"]:
-                camel_cased_key = " ".join([part.capitalize() for part in key.split("_")])
-                eval_results[camel_cased_key] = value
+                eval_results[_camel_case_key(key)] = value
         return train_log, lines, eval_results
     else:
         return train_log, lines, None
@@ -584,13 +598,13 @@ def extract_hyperparameters_from_keras(model):
 
 
 def _maybe_round(v, decimals=4):
-    if isinstance(v, float) and len(str(v).split(".")) > 1 and len(str(v).split(".")[1]) > decimals:
+    if isinstance(v, float) and round(v, decimals) != v:
         return f"{v:.{decimals}f}"
     return str(v)
 
 
 def _regular_table_line(values, col_widths):
-    values_with_space = [f"| {v}" + " " * (w - len(v) + 1) for v, w in zip(values, col_widths)]
+    values_with_space = [f"| {v.ljust(w + 1)}" for v, w in zip(values, col_widths)]
     return "".join(values_with_space) + "|\n"
 
 
@@ -605,72 +619,69 @@ def make_markdown_table(lines):
     """
     if lines is None or len(lines) == 0:
         return ""
-    col_widths = {key: len(str(key)) for key in lines[0].keys()}
-    for line in lines:
-        for key, value in line.items():
-            if col_widths[key] < len(_maybe_round(value)):
-                col_widths[key] = len(_maybe_round(value))
-
-    table = _regular_table_line(list(lines[0].keys()), list(col_widths.values()))
-    table += _second_table_line(list(col_widths.values()))
-    for line in lines:
-        table += _regular_table_line([_maybe_round(v) for v in line.values()], list(col_widths.values()))
-    return table
-
+    keys = list(lines[0].keys())
+    rows = [[_maybe_round(v) for v in line.values()] for line in lines]
+    col_widths = [len(str(key)) for key in keys]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if col_widths[i] < len(cell):
+                col_widths[i] = len(cell)
 
-_TRAINING_ARGS_KEYS = [
-    "learning_rate",
-    "train_batch_size",
-    "eval_batch_size",
-    "seed",
-]
+    table = [_regular_table_line(keys, col_widths), _second_table_line(col_widths)]
+    table.extend(_regular_table_line(row, col_widths) for row in rows)
+    return "".join(table)
 
 
 def extract_hyperparameters_from_trainer(trainer):
-    hyperparameters = {k: getattr(trainer.args, k) for k in _TRAINING_ARGS_KEYS}
-
-    if trainer.args.parallel_mode not in [ParallelMode.NOT_PARALLEL, ParallelMode.NOT_DISTRIBUTED]:
+    args = trainer.args
+    hyperparameters = {
+        "learning_rate": args.learning_rate,
+        "train_batch_size": args.train_batch_size,
+        "eval_batch_size": args.eval_batch_size,
+        "seed": args.seed,
+    }
+
+    parallel_mode = args.parallel_mode
+    if parallel_mode not in [ParallelMode.NOT_PARALLEL, ParallelMode.NOT_DISTRIBUTED]:
         hyperparameters["distributed_type"] = (
-            "multi-GPU" if trainer.args.parallel_mode == ParallelMode.DISTRIBUTED else trainer.args.parallel_mode.value
+            "multi-GPU" if parallel_mode == ParallelMode.DISTRIBUTED else parallel_mode.value
         )
-    if trainer.args.world_size > 1:
-        hyperparameters["num_devices"] = trainer.args.world_size
-    if trainer.args.gradient_accumulation_steps > 1:
-        hyperparameters["gradient_accumulation_steps"] = trainer.args.gradient_accumulation_steps
-
-    total_train_batch_size = (
-        trainer.args.train_batch_size * trainer.args.world_size * trainer.args.gradient_accumulation_steps
-    )
+    if args.world_size > 1:
+        hyperparameters["num_devices"] = args.world_size
+    if args.gradient_accumulation_steps > 1:
+        hyperparameters["gradient_accumulation_steps"] = args.gradient_accumulation_steps
+
+    total_train_batch_size = args.train_batch_size * args.world_size * args.gradient_accumulation_steps
     if total_train_batch_size != hyperparameters["train_batch_size"]:
         hyperparameters["total_train_batch_size"] = total_train_batch_size
-    total_eval_batch_size = trainer.args.eval_batch_size * trainer.args.world_size
+    total_eval_batch_size = args.eval_batch_size * args.world_size
     if total_eval_batch_size != hyperparameters["eval_batch_size"]:
         hyperparameters["total_eval_batch_size"] = total_eval_batch_size
 
-    if trainer.args.adafactor:
+    if args.adafactor:
         hyperparameters["optimizer"] = "Adafactor"
     else:
         hyperparameters[
             "optimizer"
-        ] = f"Adam with betas=({trainer.args.adam_beta1},{trainer.args.adam_beta2}) and epsilon={trainer.args.adam_epsilon}"
-
-    hyperparameters["lr_scheduler_type"] = trainer.args.lr_scheduler_type.value
-    if trainer.args.warmup_ratio != 0.0:
-        hyperparameters["lr_scheduler_warmup_ratio"] = trainer.args.warmup_ratio
-    if trainer.args.warmup_steps != 0.0:
-        hyperparameters["lr_scheduler_warmup_steps"] = trainer.args.warmup_steps
-    if trainer.args.max_steps != -1:
-        hyperparameters["training_steps"] = trainer.args.max_steps
+        ] = f"Adam with betas=({args.adam_beta1},{args.adam_beta2}) and epsilon={args.adam_epsilon}"
+
+    hyperparameters["lr_scheduler_type"] = args.lr_scheduler_type.value
+    if args.warmup_ratio != 0.0:
+        hyperparameters["lr_scheduler_warmup_ratio"] = args.warmup_ratio
+    if args.warmup_steps != 0.0:
+        hyperparameters["lr_scheduler_warmup_steps"] = args.warmup_steps
+    if args.max_steps != -1:
+        hyperparameters["training_steps"] = args.max_steps
     else:
-        hyperparameters["num_epochs"] = trainer.args.num_train_epochs
+        hyperparameters["num_epochs"] = args.num_train_epochs
 
-    if trainer.args.fp16:
+    if args.fp16:
         if trainer.use_amp:
             hyperparameters["mixed_precision_training"] = "Native AMP"
         elif trainer.use_apex:
-            hyperparameters["mixed_precision_training"] = f"Apex, opt level {trainer.args.fp16_opt_level}"
+            hyperparameters["mixed_precision_training"] = f"Apex, opt level {args.fp16_opt_level}"
 
-    if trainer.args.label_smoothing_factor != 0.0:
-        hyperparameters["label_smoothing_factor"] = trainer.args.label_smoothing_factor
+    if args.label_smoothing_factor != 0.0:
+        hyperparameters["label_smoothing_factor"] = args.label_smoothing_factor
 
     return hyperparameters